@@ -103,8 +103,10 @@ from .log_functions import (
     # Console logging control
     enable_console_logging,
     error,
+    get_log_directory,
     get_log_file,
     info,
+    is_enabled_for,
     log,
     # Decorators
     log_function_call,
@@ -205,7 +207,9 @@ __all__ = [  # noqa: RUF022
     # Configuration
     'set_log_directory',
     'get_log_file',
+    'get_log_directory',
     'log_level',
+    'is_enabled_for',
     'max_logs',
 
     # Console control
@@ -1,10 +1,54 @@
 """Formatters for the diagnostics logging system."""
 
-import json
 import logging
-from datetime import datetime
+import time
+from collections.abc import Callable
 from enum import Enum
 
+try:
+    import orjson  # type: ignore[import-not-found]
+
+    def _dumps(obj: object) -> str:
+        """Serialize an object to a JSON string using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+except ImportError:
+    import json
+
+    # json.dumps() builds a new encoder for every call with non-default
+    # options; build the one we need once and reuse its bound encode().
+    _dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+_JSON_TYPES = (str, int, float, bool, type(None), list, tuple, dict)
+
+
+def _is_json_serializable(obj: object) -> bool:
+    """Check if an object is of a type JSON can represent.
+
+    Only the object itself is checked, not the contents of a container; values
+    that still fail to encode are dropped by ``_encodable_items``.
+    """
+    return isinstance(obj, _JSON_TYPES)
+
+
+def _encodable_items(data: dict, dumps: Callable[[object], str] = _dumps) -> dict:
+    """Get the items of a dict whose values can be encoded on their own.
+
+    Args:
+        data: The dict to filter.
+        dumps: The function used to encode each value.
+
+    Returns:
+        A new dict without the items ``dumps`` refuses to encode.
+    """
+    encodable = {}
+    for key, value in data.items():
+        try:
+            dumps(value)
+        except (TypeError, ValueError):
+            continue
+        encodable[key] = value
+    return encodable
+
 
 class ANSIColors(Enum):
     """ANSI colors for console output."""
@@ -35,39 +79,72 @@ class ANSIColors(Enum):
 
 
 class JSONFormatter(logging.Formatter):
-    """Custom JSON formatter for structured logging."""
+    """Custom JSON formatter for structured logging.
 
-    def _is_json_serializable(self, obj):
-        """Check if an object is JSON serializable."""
-        try:
-            json.dumps(obj)
-            return True
-        except (TypeError, ValueError):
-            return False
+    Uses [orjson](https://github.com/ijl/orjson) for serialization when it is
+    installed, falling back to the standard library ``json`` module otherwise.
+
+    Args:
+        serializer: Function turning a log entry dict into JSON, as ``str`` or
+            UTF-8 ``bytes`` (e.g. ``orjson.dumps``). Defaults to the built-in
+            choice above.
+    """
+
+    def __init__(self, serializer: Callable[[object], str | bytes] | None = None):
+        super().__init__()
+        if serializer is None:
+            self._dumps = _dumps
+        else:
+            def dumps(obj: object) -> str:
+                text = serializer(obj)
+                return text.decode("utf-8") if isinstance(text, bytes) else text
+            self._dumps = dumps
+        # Records mostly arrive many to a second, so the date and time part of
+        # the timestamp is formatted once per second and reused.
+        self._timestamp_cache: tuple[int, str] = (-1, "")
 
     def format(self, record):
+        created = record.created
+        second = int(created)
+        cached_second, prefix = self._timestamp_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+            self._timestamp_cache = (second, prefix)
+        microseconds = min(round((created - second) * 1_000_000), 999_999)
+        # The caller fields are plain instance attributes, so read them from
+        # the record's __dict__: a miss there is a cheap dict lookup, where
+        # getattr() would raise and swallow an AttributeError.
+        fields = record.__dict__
+
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": f"{prefix}.{microseconds:06d}",
             "level": record.levelname,
             "message": record.getMessage(),
-            "caller_module": getattr(record, "caller_module", "unknown"),
-            "caller_func": getattr(record, "caller_func", "unknown"),
-            "caller_lineno": getattr(record, "caller_lineno", 0),
+            "caller_module": fields.get("caller_module", "unknown"),
+            "caller_func": fields.get("caller_func", "unknown"),
+            "caller_lineno": fields.get("caller_lineno", 0),
             "logger": record.name,
         }
 
         # Add extra_data if present (custom fields passed by user)
-        extra_data = getattr(record, "extra_data", None)
+        extra_data = fields.get("extra_data")
         if extra_data and isinstance(extra_data, dict):
             # Filter out non-serializable objects from extra_data
-            serializable_extra = {}
-            for key, value in extra_data.items():
-                if self._is_json_serializable(value):
-                    serializable_extra[key] = value
+            serializable_extra = {key: value for key, value in extra_data.items()
+                                  if _is_json_serializable(value)}
             if serializable_extra:
                 log_entry["extra_data"] = serializable_extra
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        try:
+            return self._dumps(log_entry)
+        except (TypeError, ValueError):
+            # Something inside a container, or a value the encoder refuses
+            # despite its type (e.g. integers too large for orjson): drop just
+            # the fields that fail rather than the whole of extra_data
+            extra = _encodable_items(log_entry.pop("extra_data", {}), self._dumps)
+            if extra:
+                log_entry["extra_data"] = extra
+            return self._dumps(log_entry)
 
 
 class HumanReadableFormatter(logging.Formatter):
@@ -76,25 +153,27 @@ class HumanReadableFormatter(logging.Formatter):
     def __init__(self, display_extra_fields: bool = False):
         super().__init__()
         self.display_extra_fields = display_extra_fields
+        self._timestamp_cache: tuple[int, str] = (-1, "")
 
     def format(self, record):
+        fields = record.__dict__
         extra_str = ""
         if self.display_extra_fields:
             # Format extra_data if present
-            extra_data = getattr(record, "extra_data", None)
+            extra_data = fields.get("extra_data")
             if extra_data and isinstance(extra_data, dict):
-                extra_fields = []
-                for key, value in extra_data.items():
-                    extra_fields.append(f"{key}={value}")
-                if extra_fields:
-                    extra_str = f" [{', '.join(extra_fields)}]"
-
-        caller_module = getattr(record, 'caller_module', 'unknown')
-        caller_func = getattr(record, 'caller_func', 'unknown')
-        caller_lineno = getattr(record, 'caller_lineno', 0)
-
-        timestamp = datetime.fromtimestamp(record.created).strftime(
-            '%H:%M:%S')
+                pairs = ", ".join(f"{key}={value}" for key, value in extra_data.items())
+                extra_str = f" [{pairs}]"
+
+        caller_module = fields.get("caller_module", "unknown")
+        caller_func = fields.get("caller_func", "unknown")
+        caller_lineno = fields.get("caller_lineno", 0)
+
+        second = int(record.created)
+        cached_second, timestamp = self._timestamp_cache
+        if second != cached_second:
+            timestamp = time.strftime('%H:%M:%S', time.localtime(second))
+            self._timestamp_cache = (second, timestamp)
         level_color = ANSIColors.PURPLE.value
         level_name = record.levelname
         match level_name:
@@ -3,15 +3,63 @@
 import logging
 
 
+# Size of the file object's own write buffer, large enough that a batch of
+# entries reaches the OS as a single write
+_FILE_BUFFERING = 1 << 20
+
+
 class JSONFileHandler(logging.FileHandler):
-    """Custom file handler that writes logs as a single JSON array."""
+    """Custom file handler that writes logs as a single JSON array.
+
+    Entries are collected in memory and written in one batch once
+    ``buffer_size`` characters or ``flush_every`` entries are pending, when a
+    record at ``flush_level`` or above arrives, or when the handler is flushed
+    or closed. Entries still pending when the process dies without closing
+    the handler are lost, so whoever feeds the handler should flush it when
+    records stop arriving; argus's background writer does so whenever its
+    queue is empty.
+    """
 
-    def __init__(self, filename, mode='a', encoding=None, delay=False):
+    def __init__(self, filename, mode='a', encoding=None, delay=False,
+                 buffer_size=65536, flush_level=logging.ERROR, flush_every=256):
         super().__init__(filename, mode, encoding, delay)
         self.log_entries = []
         self.state_entries = []
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_every = flush_every
+        self._pending = []
+        self._pending_size = 0
+        self._pending_count = 0
         self._initialize_file()
 
+    def _open(self):
+        """Open the log file with a write buffer sized for whole batches."""
+        # FileHandler keeps its own reference to open() so the file can still
+        # be opened during interpreter shutdown, which is when we close
+        return self._builtin_open(self.baseFilename, self.mode,
+                                  buffering=_FILE_BUFFERING,
+                                  encoding=self.encoding, errors=self.errors)
+
+    def add_state_array(self, array_json):
+        """Add every object in a serialized JSON array to the state list.
+
+        Lets a caller encode all of its state entries in a single call rather
+        than one call per entry.
+
+        Args:
+            array_json: A JSON array of state objects.
+
+        Raises:
+            ValueError: If ``array_json`` is not a JSON array.
+        """
+        array_json = array_json.strip()
+        if not (array_json.startswith("[") and array_json.endswith("]")):
+            raise ValueError(f"Expected a JSON array, got: {array_json[:50]!r}")
+        entries = array_json[1:-1].strip()
+        if entries:
+            self.state_entries.append(entries)
+
     def _initialize_file(self):
         """Initialize the JSON file with opening bracket."""
         if self.stream is None:
@@ -30,27 +78,40 @@ class JSONFileHandler(logging.FileHandler):
 
             msg = self.format(record)
             if self.log_entries:  # Add comma for all but first entry
-                self.stream.write(',\n')
-            self.stream.write(msg)
-            self.stream.flush()
+                self._pending.append(',\n')
+            self._pending.append(msg)
+            self._pending_size += len(msg) + 2
+            self._pending_count += 1
             self.log_entries.append(record)
+            if (self._pending_size >= self.buffer_size
+                    or self._pending_count >= self.flush_every
+                    or record.levelno >= self.flush_level):
+                self.flush()
         except Exception:   # pylint: disable=broad-exception-caught
             self.handleError(record)
 
+    def flush(self):
+        """Write any buffered entries to the file."""
+        with self.lock:
+            if self._pending and self.stream:
+                self.stream.write(''.join(self._pending))
+                self._pending.clear()
+                self._pending_size = 0
+                self._pending_count = 0
+            super().flush()
+
     def close(self):
         """Close the handler and complete the JSON array."""
         if self.stream:
-            self.stream.write('],\n')
-            self.stream.write('"state": [\n')
-            for i, state_entry in enumerate(self.state_entries):
-                if i < len(self.state_entries) - 1:
-                    self.stream.write(f'{state_entry},\n')
-                else:
-                    self.stream.write(f'{state_entry}\n')
-            self.stream.write('],\n"diagnostics_state": ')
+            self.flush()
             # Import at runtime to avoid circular imports
             from .log_functions import _diagnostics_state  # pylint: disable=C0415
-            self.stream.write(f'{_diagnostics_state()}')
-            self.stream.write('\n}')
+            # Assemble the rest of the document and write it in one go
+            trailer = ['],\n"state": [\n']
+            if self.state_entries:
+                trailer.append(',\n'.join(self.state_entries))
+                trailer.append('\n')
+            trailer.append(f'],\n"diagnostics_state": {_diagnostics_state()}\n}}')
+            self.stream.write(''.join(trailer))
             self.stream.flush()
             super().close()
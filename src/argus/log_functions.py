@@ -1,7 +1,7 @@
 """Core logging functions for the diagnostics system."""
 
 import atexit
-import json
+import heapq
 import logging
 import os
 import string
@@ -9,11 +9,9 @@ import sys
 import time
 import warnings
 from collections.abc import Callable
-from datetime import datetime
 from functools import wraps
-from pathlib import Path
 
-from .formatters import HumanReadableFormatter, JSONFormatter
+from .formatters import HumanReadableFormatter, JSONFormatter, _dumps, _encodable_items
 from .handlers import JSONFileHandler
 
 # region logging functions
@@ -38,25 +36,47 @@ def log(level: int, message: str, **extra_fields) -> None:
         >>> argus.log(argus.INFO, "This is an info message")
         >>> argus.log(argus.WARNING, "This is a warning message", user_id=123, ip="192.168.1.1")
     """
-    from .__init__ import logger  # pylint: disable=C0415
+    _log(level, message, 1, extra_fields)
+
+
+def _log(level: int, message: str, stacklevel: int, extra_fields: dict) -> None:
+    """Log a message, attributing it to the frame ``stacklevel`` calls above
+    the function calling this one (1 being that function's caller)."""
     if level < logger.level:
         return
-    caller_info = logger.findCaller(stack_info=False, stacklevel=3)
-    full_path = caller_info[0]
-    project_root = os.getcwd()
-    relative_path = os.path.relpath(full_path, start=project_root)
-
-    extra = {
-        "caller_module": relative_path.replace("\\", "/"),
-        "caller_func": caller_info[2],
-        "caller_lineno": caller_info[1],
-    }
+    try:
+        frame = _getframe(stacklevel + 1)
+    except ValueError:
+        # No Python caller that far up the stack, as when atexit calls
+        # argus.info or a decorated function directly
+        full_path, lineno, func_name = "(unknown file)", 0, "unknown"
+        relative_path = "unknown"
+    else:
+        code = frame.f_code
+        full_path = code.co_filename
+        lineno = frame.f_lineno
+        func_name = code.co_name
+        relative_path = _relpath_cache.get(full_path)
+        if relative_path is None:
+            relative_path = os.path.relpath(full_path, start=_project_root)
+            if _backslash_paths:
+                relative_path = relative_path.replace("\\", "/")
+            _relpath_cache[full_path] = relative_path
 
-    # Add custom extra fields under a single known key
     if extra_fields:
-        extra["extra_data"] = extra_fields
         message = string.Template(message).safe_substitute(extra_fields)
-    logger._log(level, message, args=(), extra=extra)  # pylint: disable=W0212
+
+    # Build the record directly: Logger._log would walk the stack again to
+    # find the caller we already have.
+    record = logger.makeRecord(logger.name, level, full_path, lineno,
+                               message, (), None, func_name)
+    record.caller_module = relative_path
+    record.caller_func = func_name
+    record.caller_lineno = lineno
+    # Add custom extra fields under a single known key
+    if extra_fields:
+        record.extra_data = extra_fields
+    logger.handle(record)
 
 
 def debug(message: str, **extra_fields) -> None:
@@ -74,7 +94,11 @@ def debug(message: str, **extra_fields) -> None:
         >>> argus.debug("This is a debug message")
         >>> argus.debug("This is a debug message", user_id=123, ip="192.168.1.1")
     """
-    log(logging.DEBUG, message, **extra_fields)
+    # Debug and info are the levels most often filtered out, so return
+    # before doing any other work when they are.
+    if logging.DEBUG < logger.level:
+        return
+    _log(logging.DEBUG, message, 1, extra_fields)
 
 
 def info(message: str, **extra_fields) -> None:
@@ -92,7 +116,9 @@ def info(message: str, **extra_fields) -> None:
         >>> argus.info("This is an info message")
         >>> argus.info("This is an info message", user_id=123, ip="192.168.1.1")
     """
-    log(logging.INFO, message, **extra_fields)
+    if logging.INFO < logger.level:
+        return
+    _log(logging.INFO, message, 1, extra_fields)
 
 
 def warning(message: str, **extra_fields) -> None:
@@ -116,7 +142,7 @@ def warning(message: str, **extra_fields) -> None:
         >>> argus.warning("This is a warning message", warning_type=SyntaxWarning)
     """
     warning_type = extra_fields.pop('warning_type', None)
-    log(logging.WARNING, message, **extra_fields)
+    _log(logging.WARNING, message, 1, extra_fields)
     if warning_type:
         warnings.warn(message, warning_type, stacklevel=3)
 
@@ -141,7 +167,7 @@ def error(message: str, **extra_fields) -> None:
         >>> argus.error("Invalid value", error_type=ValueError)
     """
     error_type = extra_fields.pop('error_type', None)
-    log(logging.ERROR, message, **extra_fields)
+    _log(logging.ERROR, message, 1, extra_fields)
     if error_type:
         raise error_type(message)
 
@@ -166,7 +192,7 @@ def critical(message: str, **extra_fields) -> None:
         >>> argus.critical("Invalid value", error_type=ValueError)
     """
     error_type = extra_fields.pop('error_type', None)
-    log(logging.CRITICAL, message, **extra_fields)
+    _log(logging.CRITICAL, message, 1, extra_fields)
     if error_type:
         raise error_type(message)
 
@@ -193,24 +219,29 @@ def log_function_call(func: Callable) -> Callable:
 
         This will log something like the following:
         ```
-        14:12:28 [DEBUG] main.py.my_function:200 - Calling function: my_function
-        14:12:28 [DEBUG] main.py.my_function:200 - Arguments: (1, 2)
-        14:12:28 [DEBUG] main.py.my_function:200 - Keyword arguments: {}
-        14:12:28 [DEBUG] main.py.my_function:200 - Function my_function returned: 3
+        14:12:28 [DEBUG] main.py.<module>:200 - Calling function: my_function; Arguments: (1, 2); Keyword arguments: {}
+        14:12:28 [DEBUG] main.py.<module>:200 - Function my_function returned: 3
         ```
     """
+    name = func.__name__
+    debug_level = logging.DEBUG
+    error_level = logging.ERROR
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        debug(f"Calling function: {func.__name__}")
-        debug(f"Arguments: {args}")
-        debug(f"Keyword arguments: {kwargs}")
+        # Checked per call since the level can change at any time. Formatting
+        # the arguments and result is skipped entirely when debug is off.
+        trace = debug_level >= logger.level
+        if trace:
+            _log(debug_level, f"Calling function: {name}; Arguments: {args}; Keyword arguments: {kwargs}", 1, {})
         try:
             result = func(*args, **kwargs)
-            debug(f"Function {func.__name__} returned: {result}")
-            return result
         except Exception as e:
-            error(f"Function {func.__name__} raised an exception: {e}")
+            _log(error_level, f"Function {name} raised an exception: {e}", 1, {})
             raise
+        if trace:
+            _log(debug_level, f"Function {name} returned: {result}", 1, {})
+        return result
     return wrapper
 
 
@@ -232,7 +263,7 @@ def log_timing(func: Callable) -> Callable:
 
         This will log something like the following:
         ```
-        14:12:28 [DEBUG] main.py.my_function:200 - Function my_function took 0.00 seconds
+        14:12:28 [INFO] main.py.<module>:200 - Function my_function took 0.00 seconds
         ```
 
         Note: you can combine this with ```log_function_call``` to get a
@@ -243,13 +274,17 @@ def log_timing(func: Callable) -> Callable:
         >>> def my_function(a, b):
         >>>     return a + b
     """
+    name = func.__name__
+    info_level = logging.INFO
+
     @wraps(func)
     def wrapper(*args, **kwargs):
+        if info_level < logger.level:
+            return func(*args, **kwargs)
         start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        elapsed_time = end_time - start_time
-        info(f"Function {func.__name__} took {elapsed_time:.2f} seconds")
+        elapsed_time = time.perf_counter() - start_time
+        _log(info_level, f"Function {name} took {elapsed_time:.2f} seconds", 1, {})
         return result
     return wrapper
 
@@ -276,7 +311,7 @@ def deprecated(message: str = "This function is deprecated.") -> Callable:
         def wrapper(*args, **kwargs):
             warnings.warn(f"{func.__name__}: {message}",
                           DeprecationWarning, stacklevel=2)
-            warning(f"DEPRECATED: {func.__name__}: {message}")
+            _log(logging.WARNING, f"DEPRECATED: {func.__name__}: {message}", 1, {})
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -307,7 +342,6 @@ def log_level(new_level: int) -> None:
     """
     if new_level < 0 or new_level > 100:
         raise ValueError(f"Invalid log level ({new_level}). Must be between 0 and 100.")
-    from .__init__ import logger  # pylint: disable=C0415
     logger.setLevel(new_level)
     for handler in logger.handlers:
         handler.setLevel(new_level)
@@ -316,6 +350,27 @@ def log_level(new_level: int) -> None:
         _file_handler.setLevel(new_level)
 
 
+def is_enabled_for(level: int) -> bool:
+    """Check whether messages at a logging level would be logged.
+
+    The logging functions already skip filtered messages, but their arguments
+    (including extra fields) are built before the call. Use this to skip
+    building expensive messages or extra data altogether.
+
+    Args:
+        level: The logging level to check, e.g. argus.DEBUG.
+
+    Returns:
+        True if messages at this level are logged, False otherwise.
+
+    Example:
+        >>> import argus
+        >>> if argus.is_enabled_for(argus.DEBUG):
+        >>>     argus.debug("Cache state", entries=cache.snapshot())
+    """
+    return level >= logger.level
+
+
 def enable_console_logging(display_extra_fields: bool = False) -> None:
     """Enable console logging with human-readable format.
 
@@ -349,21 +404,22 @@ def enable_console_logging(display_extra_fields: bool = False) -> None:
         Note that the module, function, and line number are all automatically
         included.
    """
-    from .__init__ import logger  # pylint: disable=C0415
-    # Remove existing console handlers
+    global _console_handler  # pylint: disable=global-statement
+    # Replace any existing console handler
     disable_console_logging()
 
     # Add new console handler with the specified formatter
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(HumanReadableFormatter(display_extra_fields))
-    logger.addHandler(console_handler)
+    _console_handler = logging.StreamHandler()
+    _console_handler.setFormatter(HumanReadableFormatter(display_extra_fields))
+    logger.addHandler(_console_handler)
 
 
 def disable_console_logging() -> None:
     """Disable console logging.
 
-    Removes all console handlers from the logger and  stops all console
-    logging output while preserving file logging if enabled.
+    Removes the console handler added by ```enable_console_logging``` and
+    stops its output while preserving file logging if enabled. Stream
+    handlers you have added to ```argus.logger``` yourself are left alone.
 
     Returns:
         None
@@ -372,12 +428,10 @@ def disable_console_logging() -> None:
         >>> import argus
         >>> argus.disable_console_logging()  # Console output is now disabled
     """
-    from .__init__ import logger  # pylint: disable=C0415
-    # Copy to avoid modification during iteration
-    for handler in logger.handlers[:]:
-        if (isinstance(handler, logging.StreamHandler) and
-                not isinstance(handler, logging.FileHandler)):
-            logger.removeHandler(handler)
+    global _console_handler  # pylint: disable=global-statement
+    if _console_handler:
+        logger.removeHandler(_console_handler)
+        _console_handler = None
 
 # endregion logging management
 
@@ -394,11 +448,24 @@ def get_log_file() -> str | None:
         >>> import argus
         >>> argus.get_log_file()  # Returns the current log file path
     """
-    if not _log_file:
-        return None
     return _log_file
 
 
+def get_log_directory() -> str | None:
+    """Get the directory the current log file is written to.
+
+    Returns:
+        The log directory or None if no log file is set.
+
+    Example:
+        >>> import argus
+        >>> argus.set_log_directory("logs")
+        >>> argus.get_log_directory()
+        'logs'
+    """
+    return os.path.dirname(_log_file) if _log_file else None
+
+
 def set_log_directory(directory: str | None, prefix: str = "") -> None:
     """Set the log directory and configure file logging.
 
@@ -414,52 +481,151 @@ def set_log_directory(directory: str | None, prefix: str = "") -> None:
         >>> argus.set_log_directory("logs")  # Logs to logs/YYYY-MM-DD_HH-MM-SS.log
         >>> argus.set_log_directory("logs", "my_app")  # Logs to logs/my_app_YYYY-MM-DD_HH-MM-SS.log
     """
-    from .__init__ import logger  # pylint: disable=C0415
-    global _file_handler, _log_file  # pylint: disable=global-statement
+    global _file_handler, _log_file, _queue_handler, _listener  # pylint: disable=global-statement
 
     if not directory:
         if _file_handler:
-            logging.getLogger().removeHandler(_file_handler)
-            _file_handler.close()
-            _file_handler = None
+            _close_file_logging()
             info("File logging disabled.")
 
         _log_file = None
         return
-    if not os.path.exists(directory):
-        os.makedirs(directory)
+    os.makedirs(directory, exist_ok=True)
+    log_name = _log_basename
     prefix = prefix.strip()
     if prefix:
-        prefix = f"{prefix}_"
+        log_name = f"{prefix}_{log_name}"
 
-    _log_file = os.path.join(directory, f"{prefix}{timestamp}.log")
     if _file_handler:
-        logger.removeHandler(_file_handler)
-        _file_handler.close()
+        _close_file_logging()
+    _log_file = os.path.join(directory, log_name)
 
     _file_handler = JSONFileHandler(_log_file, encoding="utf-8")
     _file_handler.setFormatter(JSONFormatter())
     _file_handler.setLevel(logger.level)
-    logger.addHandler(_file_handler)
 
+    # Imported here rather than at the top: logging.handlers pulls in socket
+    # and pickle, which console-only programs shouldn't pay for at import
+    import logging.handlers  # pylint: disable=C0415
+    import queue  # pylint: disable=C0415
+
+    class IdleFlushQueueListener(logging.handlers.QueueListener):
+        """Queue listener that flushes its handlers whenever the queue runs dry.
+
+        JSONFileHandler holds entries in memory until a batch fills up, so
+        without this a quiet program could keep its last few records out of
+        the file indefinitely. Flushing before each wait on an empty queue
+        bounds that to however long the writer is busy with a burst.
+        """
+
+        def dequeue(self, block):
+            if block and self.queue.empty():
+                for handler in self.handlers:
+                    handler.flush()
+            return super().dequeue(block)
+
+    # The file is written from a background thread so callers never wait on
+    # JSON encoding or disk I/O; the logger itself only sees the queue.
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.setLevel(logger.level)
+    _listener = IdleFlushQueueListener(log_queue, _file_handler,
+                                       respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(_queue_handler)
+
+    _register_exit_handler()
     info(f"File logging enabled. Logs are saved to: {_log_file}")
 
 
+def _stop_listener() -> None:
+    """Stop the background file writer once every queued record is written."""
+    global _listener  # pylint: disable=global-statement
+    if _listener:
+        _listener.stop()
+        _listener = None
+
+
+# Registered at import, ahead of run_debug_functions (which is only registered
+# once it can have work to do), so that with atexit being last-in, first-out
+# the exit-time state logging still reaches the file.
+atexit.register(_stop_listener)
+
+
+def _drain_writer_before_fork() -> None:
+    """Write out every queued record before the process forks.
+
+    The child then starts from the same file contents as the parent, rather
+    than a copy of records the parent has yet to write.
+    """
+    if _listener:
+        _listener.stop()
+        _file_handler.flush()
+
+
+def _restart_writer_after_fork() -> None:
+    """Restart the background file writer in the parent after a fork."""
+    if _listener:
+        _listener.start()
+
+
+def _log_directly_after_fork() -> None:
+    """Write straight to the log file in a forked child process.
+
+    The child inherits the queue handler but not the background writer
+    thread, so nothing would ever drain its queue. Records go to the file
+    handler directly instead, each one flushed as it is logged, since
+    children are often ended with os._exit() before anything else could
+    flush them.
+    """
+    global _queue_handler, _listener  # pylint: disable=global-statement
+    if not _queue_handler:
+        return
+    logger.removeHandler(_queue_handler)
+    _queue_handler = None
+    _listener = None
+    _file_handler.flush_every = 1
+    logger.addHandler(_file_handler)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_drain_writer_before_fork,
+                        after_in_parent=_restart_writer_after_fork,
+                        after_in_child=_log_directly_after_fork)
+
+
+def _close_file_logging() -> None:
+    """Detach the file handler from the logger and close the log file."""
+    global _file_handler, _log_file, _queue_handler  # pylint: disable=global-statement
+    if _queue_handler:
+        logger.removeHandler(_queue_handler)
+        _queue_handler = None
+    _stop_listener()
+    if _file_handler:
+        # Attached directly in a forked child
+        logger.removeHandler(_file_handler)
+        _file_handler.close()
+        _file_handler = None
+    _log_file = None
+
+
 def _cleanup_logs() -> None:
     """Remove old log files, keeping only max_logs entries."""
     if _max_logs < 1:
         return
-    log_dir = os.path.dirname(_log_file)
-    log_files = sorted(
-        [d for d in Path(log_dir).iterdir() if d.name.endswith(".log")],
-        key=lambda d: d.name
-    )
-    keep_count = len(log_files) - _max_logs
-    if keep_count > 0:
-        excess_logs = log_files[:keep_count]
-        for old_log in excess_logs:
-            old_log.unlink()
-            info(f"Removed old log file: {old_log}")
+    log_dir = os.path.dirname(_log_file) or "."
+    with os.scandir(log_dir) as entries:
+        # is_file() answers from the directory listing itself on most
+        # platforms, so it doesn't cost a stat per entry
+        log_files = [(entry.name, entry.path) for entry in entries
+                     if entry.name.endswith(".log") and entry.is_file()]
+    excess_count = len(log_files) - _max_logs
+    if excess_count <= 0:
+        return
+    # Log names start with a timestamp, so the smallest names are the oldest
+    for _, old_log in heapq.nsmallest(excess_count, log_files):
+        os.unlink(old_log)
+        info(f"Removed old log file: {old_log}")
 
 
 def max_logs(log_max: int = -1) -> None:
@@ -521,23 +687,32 @@ def register_debug_function(func: Callable, log_limit: int = -1) -> None:
     if log_limit < 0:
         log_limit = logging.DEBUG
     debug_functions.append((func, log_limit))
+    _register_exit_handler()
     debug(f"Registered exit logging function: {func.__name__}")
 
 
-@atexit.register
+def _register_exit_handler() -> None:
+    """Register run_debug_functions to run at exit, once."""
+    global _exit_handler_registered  # pylint: disable=global-statement
+    if not _exit_handler_registered:
+        atexit.register(run_debug_functions)
+        _exit_handler_registered = True
+
+
 def run_debug_functions() -> None:
     """Execute all registered debug functions and log their output."""
-    from .__init__ import logger  # pylint: disable=C0415
-    if len(debug_functions) == 0:
+    # The state is only recorded in the log file, so without one there is
+    # no reason to call the (possibly expensive) debug functions
+    if len(debug_functions) == 0 or _file_handler is None:
         return
     info("Running registered exit logging functions...")
+    state = []
     for func, log_limit in debug_functions:
         if log_limit < logger.level:
             continue
-        if "." in func.__qualname__:
-            object_name = func.__qualname__.split(".")[0]
-        else:
-            object_name = func.__name__
+        qualname = func.__qualname__
+        dot = qualname.find(".")
+        object_name = qualname[:dot] if dot >= 0 else func.__name__
 
         output = func()
         if isinstance(output, str):
@@ -546,20 +721,24 @@ def run_debug_functions() -> None:
             error(f"Debug function {object_name} returned an invalid type: "
                   f"{type(output)}. Function must return a dict or str.")
             continue
-        state_entry = {"object": object_name}
-        state_entry.update(output)
-        entry = json.dumps(state_entry, ensure_ascii=False)
-        if _file_handler:
-            _file_handler.state_entries.append(entry)
+        state.append({"object": object_name, **output})
+
+    if state and _file_handler:
+        # Encode every entry in one call
+        try:
+            state_json = _dumps(state)
+        except (TypeError, ValueError):
+            # Leave out just the values the encoder refuses
+            state_json = _dumps([_encodable_items(entry) for entry in state])
+        _file_handler.add_state_array(state_json)
 
     # Ensure the handler is properly closed to write the final JSON
-    if _file_handler:
-        _file_handler.close()
+    _close_file_logging()
 
 
 def _diagnostics_state() -> str:
     """Get the current diagnostics state as JSON string."""
-    from .__init__ import __version__, logger  # pylint: disable=C0415
+    from . import __version__  # pylint: disable=C0415
 
     diag_state = {
         "log_file": _log_file,
@@ -569,18 +748,38 @@ def _diagnostics_state() -> str:
         "timestamp": timestamp,
         "diagnostics_version": __version__,
     }
-    return json.dumps(diag_state, ensure_ascii=False)
+    return _dumps(diag_state)
 
 # endregion atexit functions
 
 # region Global variables and setup
 
 
-timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+_getframe = sys._getframe  # pylint: disable=protected-access
+
+# The same logger exposed as argus.logger
+logger: logging.Logger = logging.getLogger("ArgusLogger")
+
+timestamp: str = time.strftime("%Y-%m-%d_%H-%M-%S")
+# Log file name without any prefix; the timestamp never changes once imported
+_log_basename: str = f"{timestamp}.log"
 _max_logs: int = -1
 _log_file: str | None = None
 _file_handler: logging.FileHandler | None = None
+_console_handler: logging.StreamHandler | None = None
+# Quoted: logging.handlers is only imported once file logging is set up
+_queue_handler: "logging.handlers.QueueHandler | None" = None
+_listener: "logging.handlers.QueueListener | None" = None
 debug_functions: list[Callable] = []
+# run_debug_functions is only registered with atexit once file logging or a
+# debug function makes it useful
+_exit_handler_registered: bool = False
+
+# Caller paths are reported relative to the directory argus was imported from.
+# The set of calling files is small, so their relative paths are cached.
+_project_root: str = os.getcwd()
+_relpath_cache: dict[str, str] = {}
+_backslash_paths: bool = os.sep == "\\"
 
 
 # Initialize console logging only if not running under unittest
@@ -0,0 +1,48 @@
+"""Pytest configuration for the argus tests."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from .test_utils import attach_null_log_sink
+
+# Make the package importable from a source checkout, including in
+# pytest-xdist worker processes, without installing it first
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _argus_session():
+    """Import argus once per worker and keep it out of any default log directory."""
+    import argus
+
+    # LOG_DIRECTORY (from the environment or a .env file) turns on file
+    # logging when argus is imported; tests pick their own directories
+    if argus.get_log_file():
+        argus.set_log_directory(None)
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _argus_null_handlers(_argus_session):
+    """Discard the argus logger's records in memory for the session.
+
+    Turns console output off and attaches a NullHandler, as test classes
+    that never read the log file do, so records no test captures aren't
+    printed by logging's last-resort handler either. Tests that need file
+    output still attach their own handlers with set_log_directory(). Set
+    ARGUS_TEST_REAL_HANDLERS to keep the handlers argus installed for itself
+    instead.
+    """
+    import argus
+
+    if os.environ.get("ARGUS_TEST_REAL_HANDLERS"):
+        yield
+        return
+
+    argus.disable_console_logging()
+    log_sink = attach_null_log_sink()
+    yield
+    argus.logger.removeHandler(log_sink)
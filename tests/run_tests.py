@@ -1,75 +1,69 @@
 #!/usr/bin/env python3
-"""Test runner for the argus logging module."""
+"""Test runner for the argus logging module.
+
+Run from the repository root with argus installed (``pip install -e .``)::
+
+    python -m tests.run_tests
+"""
 
 import sys
 import unittest
 import argparse
 from pathlib import Path
 
-# Add the parent directory to the path so we can import argus
-sys.path.insert(0, str(Path(__file__).parent.parent))
+TESTS_DIR = Path(__file__).parent
+
+# Shared by every run in this process
+_LOADER = unittest.TestLoader()
+_RUNNER = unittest.TextTestRunner(verbosity=2)
+
+# Test files selectable with --tests, by name without the "test_" prefix; a
+# file is only imported when it is selected.
+TEST_MODULES = {path.stem.removeprefix("test_"): path.name
+                for path in sorted(TESTS_DIR.glob("test_*.py"))}
+
 
-from tests import (
-    test_log_functions,
-    test_decorators,
-    test_utils,
-    test_formatters,
-    test_handlers,
-    test_integration
-)
+def discover_tests(pattern="test_*.py"):
+    """Discover the test files in the tests directory matching a pattern."""
+    return _LOADER.discover(str(TESTS_DIR), pattern=pattern,
+                            top_level_dir=str(TESTS_DIR.parent))
 
 
 def run_all_tests():
     """Run all test suites."""
-    # Create test suite
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test modules
-    test_modules = [
-        test_log_functions,
-        test_decorators,
-        test_utils,
-        test_formatters,
-        test_handlers,
-        test_integration
-    ]
-    
-    for module in test_modules:
-        suite.addTests(loader.loadTestsFromModule(module))
+    # Create test suite from every test file in the directory
+    suite = discover_tests()
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    result = _RUNNER.run(suite)
     
     return result.wasSuccessful()
 
 
+def run_parallel_tests(test_names=None):
+    """Run test modules concurrently across CPU cores with pytest-xdist."""
+    import pytest
+
+    if test_names:
+        targets = [str(TESTS_DIR / TEST_MODULES[name]) for name in test_names]
+    else:
+        targets = [str(TESTS_DIR)]
+    return pytest.main(["-n", "auto", "--dist=loadfile", *targets]) == 0
+
+
 def run_specific_tests(test_names):
     """Run specific test modules or classes."""
-    loader = unittest.TestLoader()
+    unknown = [name for name in test_names if name not in TEST_MODULES]
+    if unknown:
+        print(f"Unknown test module(s): {', '.join(unknown)}")
+        return False
+
     suite = unittest.TestSuite()
-    
     for test_name in test_names:
-        if test_name == "log_functions":
-            suite.addTests(loader.loadTestsFromModule(test_log_functions))
-        elif test_name == "decorators":
-            suite.addTests(loader.loadTestsFromModule(test_decorators))
-        elif test_name == "utils":
-            suite.addTests(loader.loadTestsFromModule(test_utils))
-        elif test_name == "formatters":
-            suite.addTests(loader.loadTestsFromModule(test_formatters))
-        elif test_name == "handlers":
-            suite.addTests(loader.loadTestsFromModule(test_handlers))
-        elif test_name == "integration":
-            suite.addTests(loader.loadTestsFromModule(test_integration))
-        else:
-            print(f"Unknown test module: {test_name}")
-            return False
+        suite.addTests(discover_tests(TEST_MODULES[test_name]))
     
     # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    result = _RUNNER.run(suite)
     
     return result.wasSuccessful()
 
@@ -80,10 +74,14 @@ def main():
     parser.add_argument(
         "--tests",
         nargs="+",
-        choices=["log_functions", "decorators", "utils", "formatters", 
-                "handlers", "integration"],
+        choices=list(TEST_MODULES),
         help="Specific test modules to run"
     )
+    parser.add_argument(
+        "--parallel", "-p",
+        action="store_true",
+        help="Run tests in parallel with pytest-xdist"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -96,7 +94,9 @@ def main():
         print("Running argus module tests...")
         print("=" * 50)
     
-    if args.tests:
+    if args.parallel:
+        success = run_parallel_tests(args.tests)
+    elif args.tests:
         success = run_specific_tests(args.tests)
     else:
         success = run_all_tests()
@@ -1,26 +1,25 @@
 """Tests for decorators."""
 
 import unittest
-import tempfile
-import shutil
-import time
 import warnings
+from unittest.mock import patch
 
 import argus
+from .test_utils import attach_null_log_sink
 
 
 class TestDecorators(unittest.TestCase):
     """Test the decorators provided by the module."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        argus.set_log_directory(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Discard records in memory; none of these tests read the log file."""
+        cls.log_sink = attach_null_log_sink()
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        argus.set_log_directory(None)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        argus.logger.removeHandler(cls.log_sink)
 
     def test_log_function_call_decorator(self):
         """Test the log_function_call decorator."""
@@ -32,11 +31,13 @@ class TestDecorators(unittest.TestCase):
             result = test_function(1, 2, kwarg1="test")
         
         self.assertEqual(result, 3)
-        log_output = '\n'.join(cm.output)
-        self.assertIn("Calling function: test_function", log_output)
-        self.assertIn("Arguments: (1, 2)", log_output)
-        self.assertIn("Keyword arguments: {'kwarg1': 'test'}", log_output)
-        self.assertIn("Function test_function returned: 3", log_output)
+        self.assertEqual(len(cm.output), 2)
+        # One record for the call with its arguments, one for the result
+        call_output, return_output = cm.output
+        self.assertIn("Calling function: test_function", call_output)
+        self.assertIn("Arguments: (1, 2)", call_output)
+        self.assertIn("Keyword arguments: {'kwarg1': 'test'}", call_output)
+        self.assertIn("Function test_function returned: 3", return_output)
 
     def test_log_function_call_with_exception(self):
         """Test log_function_call decorator with exception handling."""
@@ -54,14 +55,15 @@ class TestDecorators(unittest.TestCase):
         """Test the log_timing decorator."""
         @argus.log_timing
         def slow_function():
-            time.sleep(0.01)  # Small delay to ensure measurable time
             return "done"
 
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            result = slow_function()
+        # Fake clock readings stand in for a slow function
+        with patch("argus.log_functions.time.perf_counter", side_effect=[0.0, 0.01]):
+            with self.assertLogs('ArgusLogger', level='INFO') as cm:
+                result = slow_function()
 
         self.assertEqual(result, "done")
-        self.assertIn("Function slow_function took", cm.output[0])
+        self.assertIn("Function slow_function took 0.01 seconds", cm.output[0])
 
     def test_log_timing_decorator_fast_function(self):
         """Test the log_timing decorator with a fast function."""
@@ -69,52 +71,39 @@ class TestDecorators(unittest.TestCase):
         def fast_function():
             return "fast"
 
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            result = fast_function()
+        with patch("argus.log_functions.time.perf_counter", side_effect=[0.0, 0.0001]):
+            with self.assertLogs('ArgusLogger', level='INFO') as cm:
+                result = fast_function()
 
         self.assertEqual(result, "fast")
-        self.assertIn("Function fast_function took", cm.output[0])
+        self.assertIn("Function fast_function took 0.00 seconds", cm.output[0])
 
     def test_deprecated_decorator(self):
-        """Test the deprecated decorator."""
-        @argus.deprecated("This function is deprecated")
-        def old_function():
-            return "old result"
-
+        """Test the deprecated decorator with default and custom messages."""
+        cases = [
+            (("This function is deprecated",), "deprecated"),
+            (("Custom deprecation message",), "Custom deprecation message"),
+            ((), "This function is deprecated"),
+        ]
         with warnings.catch_warnings(record=True) as w:
             warnings.simplefilter("always")
-            result = old_function()
-        
-        self.assertEqual(result, "old result")
-        self.assertEqual(len(w), 1)
-        self.assertIs(w[0].category, DeprecationWarning)
-        self.assertIn("deprecated", str(w[0].message))
+            for decorator_args, expected in cases:
+                with self.subTest(decorator_args=decorator_args):
+                    @argus.deprecated(*decorator_args)
+                    def old_function():
+                        return "old result"
 
-    def test_deprecated_decorator_custom_message(self):
-        """Test deprecated decorator with custom message."""
-        @argus.deprecated("Custom deprecation message")
-        def old_function():
-            return "old result"
+                    w.clear()
+                    result = old_function()
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            result = old_function()
-        
-        self.assertEqual(result, "old result")
-        self.assertIn("Custom deprecation message", str(w[0].message))
+                    self.assertEqual(result, "old result")
+                    self.assertEqual(len(w), 1)
+                    self.assertIs(w[0].category, DeprecationWarning)
+                    self.assertIn(expected, str(w[0].message))
 
-    def test_deprecated_decorator_default_message(self):
-        """Test deprecated decorator with default message."""
-        @argus.deprecated()
-        def old_function():
-            return "old result"
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            result = old_function()
-        
-        self.assertEqual(result, "old result")
-        self.assertIn("This function is deprecated", str(w[0].message))
+class TestDecoratorMetadata(unittest.TestCase):
+    """Test decorator behaviour that needs no log directory."""
 
     def test_decorator_preserves_function_metadata(self):
         """Test that decorators preserve function metadata."""
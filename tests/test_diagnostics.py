@@ -1,169 +1,99 @@
 """
-Unit tests for the k_diagnostics module.
+Unit tests for the argus module.
 
 This module tests all major functionality of the diagnostics system including:
 - Logging functions (debug, info, warning, error, critical)
-- System metrics (when psutil is available)
-- Decorators (log_function_call, log_timing, deprecated)
 - Configuration functions
 - Debug function management
 - Log cleanup functionality
 """
 
+import os
+import time
 import unittest
 import tempfile
-import shutil
-import time
-import warnings
 
 # Import the module to test
 import argus as diag
+from .test_utils import RecordingHandler
 
-class TestLoggingFunctions(unittest.TestCase):
-    """Test the basic logging functions."""
+class TempDirTestCase(unittest.TestCase):
+    """Base class giving each test its own directory under one shared root."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the temporary root shared by every test in the class."""
+        temp_root = tempfile.TemporaryDirectory(prefix="argus-test-",
+                                                ignore_cleanup_errors=True)
+        # Class cleanups run after the last test's tearDown has closed its
+        # log file, and even if a later part of setUpClass fails
+        cls.addClassCleanup(temp_root.cleanup)
+        cls.temp_root = temp_root.name
 
     def setUp(self):
-        """Set up test fixtures."""
-        # Create a temporary directory for logs
-        self.temp_dir = tempfile.mkdtemp()
-        diag.set_log_directory(self.temp_dir)
+        """Create this test's directory under the shared root."""
+        self.temp_dir = os.path.join(self.temp_root, self._testMethodName)
+        os.mkdir(self.temp_dir)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        diag.set_log_directory(None)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    def test_debug_logging(self):
-        """Test debug level logging."""
-        with self.assertLogs('ArgusLogger', level='DEBUG') as cm:
-            diag.debug("Test debug message")
-        
-        self.assertIn("Test debug message", cm.output[0])
-
-    def test_info_logging(self):
-        """Test info level logging."""
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            diag.info("Test info message")
-        
-        self.assertIn("Test info message", cm.output[0])
+class TestLoggingFunctions(unittest.TestCase):
+    """Test the basic logging functions."""
 
-    def test_warning_logging(self):
-        """Test warning level logging."""
-        with self.assertLogs('ArgusLogger', level='WARNING') as cm:
-            diag.warning("Test warning message")
-        
-        self.assertIn("Test warning message", cm.output[0])
+    @classmethod
+    def setUpClass(cls):
+        """Capture records in memory for every test in the class."""
+        cls.original_log_level = diag.logger.level
+        diag.log_level(diag.DEBUG)
+        cls.recorder = RecordingHandler()
+        diag.logger.addHandler(cls.recorder)
 
-    def test_error_logging(self):
-        """Test error level logging."""
-        with self.assertLogs('ArgusLogger', level='ERROR') as cm:
-            diag.error("Test error message")
-        
-        self.assertIn("Test error message", cm.output[0])
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up test fixtures."""
+        diag.logger.removeHandler(cls.recorder)
+        diag.log_level(cls.original_log_level)
 
-    def test_critical_logging(self):
-        """Test critical level logging."""
-        with self.assertLogs('ArgusLogger', level='CRITICAL') as cm:
-            diag.critical("Test critical message")
-        
-        self.assertIn("Test critical message", cm.output[0])
+    def setUp(self):
+        """Start each test with no captured records."""
+        self.recorder.records.clear()
+
+    def test_level_logging(self):
+        """Test logging at each of the standard levels."""
+        cases = [
+            ("DEBUG", diag.debug),
+            ("INFO", diag.info),
+            ("WARNING", diag.warning),
+            ("ERROR", diag.error),
+            ("CRITICAL", diag.critical),
+        ]
+        for level, log_function in cases:
+            with self.subTest(level=level):
+                message = f"Test {level.lower()} message"
+                log_function(message)
+
+                record = self.recorder.records[-1]
+                self.assertEqual(record.levelname, level)
+                self.assertIn(message, record.getMessage())
 
     def test_log_with_custom_level(self):
         """Test logging with custom level."""
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            diag.log(diag.INFO, "Test custom level message")
-        
-        self.assertIn("Test custom level message", cm.output[0])
-
-class TestDecorators(unittest.TestCase):
-    """Test the decorators provided by the module."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        diag.set_log_directory(self.temp_dir)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        diag.set_log_directory(None)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_log_function_call_decorator(self):
-        """Test the log_function_call decorator."""
-        @diag.log_function_call
-        def test_function(arg1, arg2, kwarg1="default"):
-            return arg1 + arg2
-
+        levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+        # Kept on assertLogs to check that argus records still work with
+        # unittest's own log capture; one capture covers every level
         with self.assertLogs('ArgusLogger', level='DEBUG') as cm:
-            result = test_function(1, 2, kwarg1="test")
-        
-        self.assertEqual(result, 3)
-        log_output = '\n'.join(cm.output)
-        self.assertIn("Calling function: test_function", log_output)
-        self.assertIn("Arguments: (1, 2)", log_output)
-        self.assertIn("Keyword arguments: {'kwarg1': 'test'}", log_output)
-        self.assertIn("Function test_function returned: 3", log_output)
-
-    def test_log_function_call_with_exception(self):
-        """Test log_function_call decorator with exception handling."""
-        @diag.log_function_call
-        def failing_function():
-            raise ValueError("Test exception")
-
-        with self.assertLogs('ArgusLogger', level='ERROR') as cm:
-            with self.assertRaises(ValueError):
-                failing_function()
-        
-        self.assertIn("Function failing_function raised an exception", cm.output[0])
-
-    def test_log_timing_decorator(self):
-        """Test the log_timing decorator."""
-        @diag.log_timing
-        def slow_function():
-            time.sleep(0.01)  # Small delay to ensure measurable time
-            return "done"
-
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            result = slow_function()
-
-        self.assertEqual(result, "done")
-        self.assertIn("Function slow_function took", cm.output[0])
-
-    def test_deprecated_decorator(self):
-        """Test the deprecated decorator."""
-        @diag.deprecated("This function is deprecated")
-        def old_function():
-            return "old result"
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            result = old_function()
-        
-        self.assertEqual(result, "old result")
-        self.assertEqual(len(w), 1)
-        self.assertIs(w[0].category, DeprecationWarning)
-        self.assertIn("deprecated", str(w[0].message))
-
-    def test_deprecated_decorator_custom_message(self):
-        """Test deprecated decorator with custom message."""
-        @diag.deprecated("Custom deprecation message")
-        def old_function():
-            return "old result"
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            result = old_function()
-        
-        self.assertEqual(result, "old result")
-        self.assertIn("Custom deprecation message", str(w[0].message))
+            for level in levels:
+                diag.log(getattr(diag, level), f"Test custom {level} message")
 
+        for level, output in zip(levels, cm.output, strict=True):
+            with self.subTest(level=level):
+                self.assertEqual(output, f"{level}:ArgusLogger:Test custom {level} message")
 
-class TestConfigurationFunctions(unittest.TestCase):
+class TestConfigurationFunctions(TempDirTestCase):
     """Test configuration functions."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         # Get logger from the diagnostics module directly
         self.original_log_level = diag.logger.level
 
@@ -171,15 +101,38 @@ class TestConfigurationFunctions(unittest.TestCase):
         """Clean up test fixtures."""
         diag.set_log_directory(None)
         diag.log_level(self.original_log_level)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_set_log_directory(self):
         """Test setting log directory."""
         diag.set_log_directory(self.temp_dir)
-        # Test that the directory was set (we can't get it back, but we can verify it works)
-        
+        # The new log file goes in the directory; compare paths rather than
+        # look for a separator character so the check holds on every OS
+        log_file = diag.get_log_file()
+        self.assertIsNotNone(log_file)
+        self.assertEqual(os.path.dirname(log_file), self.temp_dir)
+        self.assertEqual(diag.get_log_directory(), self.temp_dir)
+
         diag.set_log_directory(None)
         # Test that setting to None works
+        self.assertIsNone(diag.get_log_directory())
+
+    def test_idle_writer_flushes_log_file(self):
+        """Test that records reach the file once logging goes quiet."""
+        diag.log_level(diag.INFO)
+        diag.set_log_directory(self.temp_dir)
+        diag.info("written while the log file is still open")
+
+        # Below flush_level and far short of a full batch, so only the idle
+        # background writer puts this in the file before it is closed
+        deadline = time.monotonic() + 5
+        while True:
+            with open(diag.get_log_file(), encoding="utf-8") as f:
+                content = f.read()
+            if "written while the log file is still open" in content:
+                break
+            self.assertLess(time.monotonic(), deadline,
+                            "record was not flushed to the log file")
+            time.sleep(0.01)
 
     def test_log_level_setting(self):
         """Test setting log level."""
@@ -199,18 +152,17 @@ class TestConfigurationFunctions(unittest.TestCase):
         self.assertTrue(True)
 
 
-class TestDebugFunctionManagement(unittest.TestCase):
+class TestDebugFunctionManagement(TempDirTestCase):
     """Test debug function registration and execution."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         diag.set_log_directory(self.temp_dir)
 
     def tearDown(self):
         """Clean up test fixtures."""
         diag.set_log_directory(None)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_register_debug_function(self):
         """Test registering a debug function."""
@@ -221,12 +173,12 @@ class TestDebugFunctionManagement(unittest.TestCase):
             diag.register_debug_function(test_debug_func)
         
         self.assertIn("Registered exit logging function: test_debug_func", cm.output[0])
-class TestLogCleanup(unittest.TestCase):
+class TestLogCleanup(TempDirTestCase):
     """Test log cleanup functionality."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.original_max_logs = getattr(diag, '_max_logs', -1)
         diag.set_log_directory(self.temp_dir)
 
@@ -235,7 +187,6 @@ class TestLogCleanup(unittest.TestCase):
         diag.set_log_directory(None)
         if hasattr(diag, '_max_logs'):
             diag._max_logs = self.original_max_logs
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_cleanup_logs_disabled(self):
         """Test cleanup when max_logs is -1 (disabled)."""
@@ -259,8 +210,3 @@ class TestModuleConstants(unittest.TestCase):
         self.assertEqual(diag.WARNING, logging.WARNING)
         self.assertEqual(diag.ERROR, logging.ERROR)
         self.assertEqual(diag.CRITICAL, logging.CRITICAL)
-
-
-if __name__ == '__main__':
-    
-    unittest.main()
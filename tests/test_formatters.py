@@ -1,11 +1,51 @@
 """Tests for formatters."""
 
+import collections
+import copy
+import importlib.util
 import unittest
 import json
 import logging
-from datetime import datetime
 
 from argus.formatters import JSONFormatter, HumanReadableFormatter
+from .test_utils import FIXED_CREATED
+
+# Constructing a LogRecord captures process and thread details, so build one
+# prototype and copy it per test
+_PROTOTYPE_RECORD = logging.LogRecord(
+    name="test_logger",
+    level=logging.INFO,
+    pathname="test.py",
+    lineno=10,
+    msg="Test message",
+    args=(),
+    exc_info=None
+)
+_PROTOTYPE_RECORD.created = FIXED_CREATED
+
+_CALLER_FIELDS = {
+    "caller_module": "test_module",
+    "caller_func": "test_function",
+    "caller_lineno": 15,
+}
+
+
+def _make_record(level=logging.INFO, with_caller=True, **fields):
+    """Return a test record at the given level with extra attributes set.
+
+    Args:
+        level: The record's log level.
+        with_caller: Whether to set the caller fields argus adds to records.
+        **fields: Further attributes to set on the record, such as extra_data.
+    """
+    record = copy.copy(_PROTOTYPE_RECORD)
+    if level != logging.INFO:
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+    if with_caller:
+        record.__dict__.update(_CALLER_FIELDS)
+    record.__dict__.update(fields)
+    return record
 
 
 class TestJSONFormatter(unittest.TestCase):
@@ -17,21 +57,7 @@ class TestJSONFormatter(unittest.TestCase):
 
     def test_format_basic_record(self):
         """Test formatting a basic log record."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
-        
-        # Add custom fields
-        record.caller_module = "test_module"
-        record.caller_func = "test_function"
-        record.caller_lineno = 15
+        record = _make_record()
         
         formatted = self.formatter.format(record)
         parsed = json.loads(formatted)
@@ -46,25 +72,7 @@ class TestJSONFormatter(unittest.TestCase):
 
     def test_format_with_extra_fields(self):
         """Test formatting with extra fields."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
-        record.caller_module = "test_module"
-        record.caller_func = "test_function"
-        record.caller_lineno = 15
-        
-        # Add extra fields
-        record.extra_data = {
-            "user_id": 123, 
-            "action": "login"
-        }
+        record = _make_record(extra_data={"user_id": 123, "action": "login"})
         
         formatted = self.formatter.format(record)
         parsed = json.loads(formatted)
@@ -73,18 +81,37 @@ class TestJSONFormatter(unittest.TestCase):
         self.assertEqual(parsed["extra_data"]["user_id"], 123)
         self.assertEqual(parsed["extra_data"]["action"], "login")
 
+    def test_format_drops_unserializable_extra_fields(self):
+        """Test that non-serializable extra fields are left out."""
+        cycle = []
+        cycle.append(cycle)
+        record = _make_record(with_caller=False, extra_data={
+            "user_id": 123,
+            "tags": ["a", {"b": [1, 2.5, None]}],
+            "callback": lambda x: x,
+            "nested": {"handler": object()},
+            "cycle": cycle,
+        })
+
+        formatted = self.formatter.format(record)
+        parsed = json.loads(formatted)
+
+        self.assertEqual(parsed["extra_data"],
+                         {"user_id": 123, "tags": ["a", {"b": [1, 2.5, None]}]})
+
+    def test_format_preserves_unicode(self):
+        """Test that non-ASCII text is written as-is rather than escaped."""
+        record = _make_record(msg="Unicode: éñç", extra_data={"name": "名前"})
+
+        formatted = self.formatter.format(record)
+
+        self.assertIn("Unicode: éñç", formatted)
+        self.assertIn("名前", formatted)
+        self.assertEqual(json.loads(formatted)["extra_data"], {"name": "名前"})
+
     def test_format_with_missing_fields(self):
         """Test formatting with missing caller fields."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
+        record = _make_record(with_caller=False)
         
         formatted = self.formatter.format(record)
         parsed = json.loads(formatted)
@@ -94,6 +121,29 @@ class TestJSONFormatter(unittest.TestCase):
         self.assertEqual(parsed["caller_lineno"], 0)
 
 
+@unittest.skipUnless(importlib.util.find_spec("orjson"), "orjson required")
+class TestJSONFormatterOrjson(TestJSONFormatter):
+    """Run the JSONFormatter tests with orjson passed in as the serializer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        import orjson
+        self.formatter = JSONFormatter(serializer=orjson.dumps)
+
+    def test_format_keeps_fields_orjson_accepts(self):
+        """Test that only the fields orjson refuses are dropped."""
+        Point = collections.namedtuple("Point", "x y")
+        record = _make_record(with_caller=False, extra_data={
+            "point": Point(1, 2),
+            "big": 2**70,
+            "ok": 1,
+        })
+
+        parsed = json.loads(self.formatter.format(record))
+
+        self.assertEqual(parsed["extra_data"], {"ok": 1})
+
+
 class TestHumanReadableFormatter(unittest.TestCase):
     """Test HumanReadableFormatter."""
 
@@ -103,19 +153,7 @@ class TestHumanReadableFormatter(unittest.TestCase):
 
     def test_format_basic_record(self):
         """Test formatting a basic log record."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
-        record.caller_module = "test_module"
-        record.caller_func = "test_function"
-        record.caller_lineno = 15
+        record = _make_record()
         
         formatted = self.formatter.format(record)
         
@@ -126,25 +164,7 @@ class TestHumanReadableFormatter(unittest.TestCase):
 
     def test_format_with_extra_fields(self):
         """Test formatting with extra fields."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
-        record.caller_module = "test_module"
-        record.caller_func = "test_function"
-        record.caller_lineno = 15
-        
-        # Add extra fields
-        record.extra_data = {
-            "user_id": 123,
-            "action": "login"
-        }
+        record = _make_record(extra_data={"user_id": 123, "action": "login"})
         
         formatted = self.formatter.format(record)
         
@@ -153,19 +173,7 @@ class TestHumanReadableFormatter(unittest.TestCase):
 
     def test_format_without_extra_fields(self):
         """Test formatting without extra fields."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
-        record.caller_module = "test_module"
-        record.caller_func = "test_function"
-        record.caller_lineno = 15
+        record = _make_record()
         
         formatted = self.formatter.format(record)
         
@@ -176,16 +184,7 @@ class TestHumanReadableFormatter(unittest.TestCase):
 
     def test_format_with_missing_fields(self):
         """Test formatting with missing caller fields."""
-        record = logging.LogRecord(
-            name="test_logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None
-        )
-        record.created = datetime.now().timestamp()
+        record = _make_record(with_caller=False)
         
         formatted = self.formatter.format(record)
         
@@ -198,23 +197,7 @@ class TestHumanReadableFormatter(unittest.TestCase):
         level_names = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
         
         for level, level_name in zip(levels, level_names):
-            record = logging.LogRecord(
-                name="test_logger",
-                level=level,
-                pathname="test.py",
-                lineno=10,
-                msg="Test message",
-                args=(),
-                exc_info=None
-            )
-            record.created = datetime.now().timestamp()
-            record.caller_module = "test_module"
-            record.caller_func = "test_function"
-            record.caller_lineno = 15
-            
+            record = _make_record(level)
+
             formatted = self.formatter.format(record)
             self.assertIn(level_name, formatted)
-
-
-if __name__ == '__main__':
-    unittest.main()
@@ -1,15 +1,13 @@
 """Tests for handlers."""
 
 import unittest
-import tempfile
-import shutil
 import json
 import logging
 import os
-from datetime import datetime
 
-from handlers import JSONFileHandler
-from formatters import JSONFormatter
+from argus.handlers import JSONFileHandler
+from argus.formatters import JSONFormatter
+from .test_utils import FIXED_CREATED, temp_dir_for
 
 
 class TestJSONFileHandler(unittest.TestCase):
@@ -17,13 +15,9 @@ class TestJSONFileHandler(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = temp_dir_for(self)
         self.log_file = os.path.join(self.temp_dir, "test.log")
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_handler_initialization(self):
         """Test handler initialization."""
         handler = JSONFileHandler(self.log_file)
@@ -53,7 +47,7 @@ class TestJSONFileHandler(unittest.TestCase):
             args=(),
             exc_info=None
         )
-        record.created = datetime.now().timestamp()
+        record.created = FIXED_CREATED
         record.caller_module = "test_module"
         record.caller_func = "test_function"
         record.caller_lineno = 15
@@ -83,7 +77,7 @@ class TestJSONFileHandler(unittest.TestCase):
                 args=(),
                 exc_info=None
             )
-            record.created = datetime.now().timestamp()
+            record.created = FIXED_CREATED
             record.caller_module = "test_module"
             record.caller_func = "test_function"
             record.caller_lineno = 15
@@ -112,7 +106,7 @@ class TestJSONFileHandler(unittest.TestCase):
             args=(),
             exc_info=None
         )
-        record.created = datetime.now().timestamp()
+        record.created = FIXED_CREATED
         record.caller_module = "test_module"
         record.caller_func = "test_function"
         record.caller_lineno = 15
@@ -133,6 +127,31 @@ class TestJSONFileHandler(unittest.TestCase):
             except json.JSONDecodeError as e:
                 self.fail(f"Generated file is not valid JSON: {e}")
 
+    def test_flush_every(self):
+        """Test that pending entries are written once flush_every are queued."""
+        handler = JSONFileHandler(self.log_file, flush_every=2)
+        handler.setFormatter(JSONFormatter())
+
+        for message in ("First message", "Second message"):
+            record = logging.LogRecord(
+                name="test_logger",
+                level=logging.INFO,
+                pathname="test.py",
+                lineno=10,
+                msg=message,
+                args=(),
+                exc_info=None
+            )
+            record.created = FIXED_CREATED
+            handler.emit(record)
+
+        # Both entries reach the file before the handler is closed
+        with open(self.log_file, 'r') as f:
+            content = f.read()
+        handler.close()
+        self.assertIn("First message", content)
+        self.assertIn("Second message", content)
+
     def test_state_entries(self):
         """Test adding state entries."""
         handler = JSONFileHandler(self.log_file)
@@ -166,6 +185,27 @@ class TestJSONFileHandler(unittest.TestCase):
             except json.JSONDecodeError as e:
                 self.fail(f"Generated file is not valid JSON: {e}")
 
+    def test_state_array(self):
+        """Test adding state entries as one serialized array."""
+        handler = JSONFileHandler(self.log_file)
+        handler.setFormatter(JSONFormatter())
+
+        handler.state_entries.append(json.dumps({"object": "test1"}))
+        handler.add_state_array(json.dumps([{"object": "test2"}, {"object": "test3"}]))
+        handler.add_state_array("[]")
+        handler.add_state_array(' \n[\n  {"object": "test4"}\n]\n ')
+        for invalid in ("{}", "null", ""):
+            with self.subTest(invalid=invalid):
+                with self.assertRaises(ValueError):
+                    handler.add_state_array(invalid)
+
+        handler.close()
+
+        with open(self.log_file, 'r') as f:
+            parsed = json.load(f)
+        self.assertEqual([entry["object"] for entry in parsed["state"]],
+                         ["test1", "test2", "test3", "test4"])
+
     def test_handler_with_exception(self):
         """Test handler behavior with exceptions."""
         handler = JSONFileHandler(self.log_file)
@@ -181,7 +221,7 @@ class TestJSONFileHandler(unittest.TestCase):
             args=(),
             exc_info=None
         )
-        record.created = datetime.now().timestamp()
+        record.created = FIXED_CREATED
         
         # Add a non-serializable object to test error handling
         # Function is not JSON serializable
@@ -215,7 +255,7 @@ class TestJSONFileHandler(unittest.TestCase):
             args=(),
             exc_info=None
         )
-        record.created = datetime.now().timestamp()
+        record.created = FIXED_CREATED
         record.caller_module = "test_module"
         record.caller_func = "test_function"
         record.caller_lineno = 15
@@ -1,15 +1,15 @@
 """Integration tests for the complete logging system."""
 
 import unittest
-import tempfile
-import shutil
 import json
+import logging.handlers
+import multiprocessing
 import warnings
 from pathlib import Path
 
 import argus
 from argus.log_functions import run_debug_functions
-from .test_utils import close_file_handler
+from .test_utils import close_file_handler, temp_dir_for
 
 
 class TestIntegration(unittest.TestCase):
@@ -17,7 +17,7 @@ class TestIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = temp_dir_for(self)
         # Reset logging state for each test
         argus.set_log_directory(None)
         # Clear debug functions between tests
@@ -34,11 +34,8 @@ class TestIntegration(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures."""
         # Clean up any file logging
-        from argus.log_functions import _file_handler
-        if _file_handler:
-            _file_handler.close()
+        close_file_handler()
         argus.set_log_directory(None)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_complete_logging_workflow(self):
         """Test complete logging workflow with file and console output."""
@@ -143,6 +140,15 @@ class TestIntegration(unittest.TestCase):
             self.assertTrue(any("DEPRECATED: old_function" in msg 
                               for msg in messages))
 
+    def test_debug_functions_skipped_without_log_file(self):
+        """Test that debug functions aren't called when no log file is set."""
+        calls = []
+        argus.register_debug_function(lambda: calls.append(1) or {})
+
+        run_debug_functions()
+
+        self.assertEqual(calls, [])
+
     def test_debug_function_registration(self):
         """Test debug function registration and execution."""
         argus.set_log_directory(self.temp_dir)
@@ -162,6 +168,12 @@ class TestIntegration(unittest.TestCase):
         
         # Manually run debug functions (normally done at exit)
         run_debug_functions()
+
+        # File logging is fully torn down, so later records aren't queued
+        # for a writer that has stopped
+        self.assertIsNone(argus.get_log_file())
+        self.assertFalse(any(isinstance(handler, logging.handlers.QueueHandler)
+                             for handler in argus.logger.handlers))
         
         # Check log file
         log_files = list(Path(self.temp_dir).glob("*.log"))
@@ -184,6 +196,22 @@ class TestIntegration(unittest.TestCase):
             self.assertTrue(any("TestIntegration" in entry.get("object", "") 
                               for entry in state_messages))
 
+    def test_debug_function_unencodable_values(self):
+        """Test that state values the encoder refuses are left out."""
+        argus.set_log_directory(self.temp_dir)
+        argus.log_level(argus.DEBUG)
+        argus.register_debug_function(
+            lambda: {"ok": 1, "handler": object(), "big": 2**70})
+
+        run_debug_functions()
+
+        log_files = list(Path(self.temp_dir).glob("*.log"))
+        with open(log_files[0], 'r') as f:
+            state = json.load(f)["state"]
+        self.assertEqual(len(state), 1)
+        self.assertEqual(state[0]["ok"], 1)
+        self.assertNotIn("handler", state[0])
+
     def test_log_level_filtering(self):
         """Test log level filtering."""
         argus.set_log_directory(self.temp_dir)
@@ -216,6 +244,30 @@ class TestIntegration(unittest.TestCase):
             self.assertIn("Info message", messages)
             self.assertIn("Warning message", messages)
 
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(),
+                         "fork start method required")
+    def test_logging_from_forked_child(self):
+        """Test that a forked child's records reach the log file."""
+        argus.set_log_directory(self.temp_dir)
+        argus.log_level(argus.INFO)
+        argus.info("Parent message")
+
+        child = multiprocessing.get_context("fork").Process(
+            target=argus.info, args=("Child message",))
+        child.start()
+        child.join()
+        self.assertEqual(child.exitcode, 0)
+
+        close_file_handler()
+
+        log_files = list(Path(self.temp_dir).glob("*.log"))
+        with open(log_files[0], 'r') as f:
+            messages = [log["message"] for log in json.load(f)["logs"]]
+        # The parent's queued record is written out before the fork, so the
+        # child doesn't inherit and write a second copy of it
+        self.assertEqual(messages.count("Parent message"), 1)
+        self.assertEqual(messages.count("Child message"), 1)
+
     def test_console_and_file_logging(self):
         """Test that both console and file logging work together."""
         argus.set_log_directory(self.temp_dir)
@@ -269,6 +321,7 @@ class TestIntegration(unittest.TestCase):
         self.assertTrue(hasattr(argus, 'register_debug_function'))
         self.assertTrue(hasattr(argus, 'max_logs'))
         self.assertTrue(hasattr(argus, 'log_level'))
+        self.assertTrue(hasattr(argus, 'is_enabled_for'))
         self.assertTrue(hasattr(argus, 'enable_console_logging'))
         self.assertTrue(hasattr(argus, 'disable_console_logging'))
         
@@ -2,93 +2,113 @@
 
 import os
 import unittest
-import tempfile
-import shutil
 import logging
 
 import argus
+from argus.formatters import HumanReadableFormatter
+from argus.log_functions import _log
+from .test_utils import RecordingHandler
 
 
 class TestLogFunctions(unittest.TestCase):
     """Test the core logging functions."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        argus.set_log_directory(self.temp_dir)
+    @classmethod
+    def setUpClass(cls):
+        """Capture records in memory for every test in the class."""
+        cls.original_log_level = argus.logger.level
+        argus.log_level(argus.DEBUG)
+        cls.recorder = RecordingHandler()
+        argus.logger.addHandler(cls.recorder)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        argus.set_log_directory(None)
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        argus.logger.removeHandler(cls.recorder)
+        argus.log_level(cls.original_log_level)
+
+    def setUp(self):
+        """Start each test with no captured records."""
+        self.recorder.records.clear()
+
+    def assertLogged(self, level_name, message):
+        """Assert that the only captured record has the given level and message."""
+        self.assertEqual(len(self.recorder.records), 1)
+        record = self.recorder.records[0]
+        self.assertEqual(record.levelname, level_name)
+        self.assertIn(message, record.getMessage())
+
+    def test_log_without_caller_frame(self):
+        """Test logging when the stack is shallower than the caller level."""
+        # Stands in for atexit calling argus.info, where no Python frame
+        # called into argus
+        _log(logging.INFO, "No caller", 10_000, {})
+
+        self.assertLogged("INFO", "No caller")
+        record = self.recorder.records[0]
+        self.assertEqual(record.caller_module, "unknown")
+        self.assertEqual(record.caller_func, "unknown")
+        self.assertEqual(record.caller_lineno, 0)
 
     def test_debug_logging(self):
         """Test debug level logging."""
-        with self.assertLogs('ArgusLogger', level='DEBUG') as cm:
-            argus.debug("Test debug message")
-        
-        self.assertIn("Test debug message", cm.output[0])
+        argus.debug("Test debug message")
+
+        self.assertLogged("DEBUG", "Test debug message")
 
     def test_info_logging(self):
         """Test info level logging."""
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            argus.info("Test info message")
-        
-        self.assertIn("Test info message", cm.output[0])
+        argus.info("Test info message")
+
+        self.assertLogged("INFO", "Test info message")
 
     def test_warning_logging(self):
         """Test warning level logging."""
-        with self.assertLogs('ArgusLogger', level='WARNING') as cm:
-            argus.warning("Test warning message")
-        
-        self.assertIn("Test warning message", cm.output[0])
+        argus.warning("Test warning message")
+
+        self.assertLogged("WARNING", "Test warning message")
 
     def test_error_logging(self):
         """Test error level logging."""
-        with self.assertLogs('ArgusLogger', level='ERROR') as cm:
-            argus.error("Test error message")
-        
-        self.assertIn("Test error message", cm.output[0])
+        argus.error("Test error message")
+
+        self.assertLogged("ERROR", "Test error message")
 
     def test_critical_logging(self):
         """Test critical level logging."""
-        with self.assertLogs('ArgusLogger', level='CRITICAL') as cm:
-            argus.critical("Test critical message")
-        
-        self.assertIn("Test critical message", cm.output[0])
+        argus.critical("Test critical message")
+
+        self.assertLogged("CRITICAL", "Test critical message")
 
     def test_logging_with_extra_fields(self):
         """Test logging with extra fields."""
-        with self.assertLogs('ArgusLogger', level='INFO') as cm:
-            argus.info("Test message", user_id=123, action="login")
-        
-        log_output = cm.output[0]
-        self.assertIn("Test message", log_output)
+        argus.info("Test message", user_id=123, action="login")
+
+        self.assertLogged("INFO", "Test message")
         # Extra fields should be included in the log
+        self.assertEqual(self.recorder.records[0].extra_data,
+                         {"user_id": 123, "action": "login"})
 
     def test_warning_with_warning_type(self):
         """Test warning with warning type."""
-        with self.assertLogs('ArgusLogger', level='WARNING') as cm:
-            with self.assertWarns(UserWarning):
-                argus.warning("Test warning", warning_type=UserWarning)
-        
-        self.assertIn("Test warning", cm.output[0])
+        with self.assertWarns(UserWarning):
+            argus.warning("Test warning", warning_type=UserWarning)
+
+        self.assertLogged("WARNING", "Test warning")
 
     def test_error_with_exception_type(self):
         """Test error with exception type."""
-        with self.assertLogs('ArgusLogger', level='ERROR') as cm:
-            with self.assertRaises(ValueError):
-                argus.error("Test error", error_type=ValueError)
-        
-        self.assertIn("Test error", cm.output[0])
+        with self.assertRaises(ValueError):
+            argus.error("Test error", error_type=ValueError)
+
+        self.assertLogged("ERROR", "Test error")
 
     def test_critical_with_exception_type(self):
         """Test critical with exception type."""
-        with self.assertLogs('ArgusLogger', level='CRITICAL') as cm:
-            with self.assertRaises(RuntimeError):
-                argus.critical("Test critical", error_type=RuntimeError)
-        
-        self.assertIn("Test critical", cm.output[0])
+        with self.assertRaises(RuntimeError):
+            argus.critical("Test critical", error_type=RuntimeError)
+
+        self.assertLogged("CRITICAL", "Test critical")
 
 
 class TestLogLevels(unittest.TestCase):
@@ -110,6 +130,48 @@ class TestLogLevels(unittest.TestCase):
         argus.log_level(argus.ERROR)
         self.assertEqual(argus.logger.level, logging.ERROR)
 
+    def test_is_enabled_for(self):
+        """Test checking whether a level would be logged."""
+        self.addCleanup(argus.log_level, argus.logger.level)
+        argus.log_level(argus.INFO)
+
+        self.assertFalse(argus.is_enabled_for(argus.DEBUG))
+        self.assertTrue(argus.is_enabled_for(argus.INFO))
+        self.assertTrue(argus.is_enabled_for(argus.ERROR))
+
+
+class TestConsoleLogging(unittest.TestCase):
+    """Test enabling and disabling console output."""
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        argus.disable_console_logging()
+
+    def test_enable_replaces_console_handler(self):
+        """Test that enabling twice leaves a single console handler."""
+        argus.enable_console_logging()
+        argus.enable_console_logging(display_extra_fields=True)
+
+        console_handlers = [handler for handler in argus.logger.handlers
+                            if isinstance(handler.formatter, HumanReadableFormatter)]
+        self.assertEqual(len(console_handlers), 1)
+        self.assertTrue(console_handlers[0].formatter.display_extra_fields)
+
+    def test_disable_keeps_other_stream_handlers(self):
+        """Test that disabling only removes argus's own console handler."""
+        own_handler = logging.StreamHandler()
+        argus.logger.addHandler(own_handler)
+        self.addCleanup(argus.logger.removeHandler, own_handler)
+        handlers_before = set(argus.logger.handlers)
+        argus.enable_console_logging()
+        console_handlers = set(argus.logger.handlers) - handlers_before
+
+        argus.disable_console_logging()
+
+        self.assertIn(own_handler, argus.logger.handlers)
+        self.assertEqual(len(console_handlers), 1)
+        self.assertTrue(console_handlers.isdisjoint(argus.logger.handlers))
+
 
 if __name__ == '__main__':
     unittest.main()
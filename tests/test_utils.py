@@ -1,5 +1,42 @@
 """Test utilities for the argus module."""
 
+import logging
+import tempfile
+
+# Fixed creation time for test records, so tests don't read the clock
+FIXED_CREATED = 1_700_000_000.0
+
+
+class RecordingHandler(logging.Handler):
+    """Logging handler that keeps every record it receives in memory.
+
+    Attach one per test class and clear ``records`` between tests, instead
+    of installing and removing a capture handler with ``assertLogs`` in
+    every test.
+    """
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def attach_null_log_sink():
+    """Attach a NullHandler to the argus logger and return it.
+
+    Tests that never read the log file use this instead of
+    ``set_log_directory()``, so their records are dropped in memory rather
+    than written to disk. Remove the handler again when the test is done.
+    """
+    # Imported here so test modules that only need the helpers above don't
+    # have to import argus
+    from argus import logger
+    handler = logging.NullHandler()
+    logger.addHandler(handler)
+    return handler
+
 
 def close_file_handler():
     """Close the file handler to ensure JSON structure is completed.
@@ -8,7 +45,22 @@ def close_file_handler():
     It ensures that the JSON file handler is properly closed so that
     the JSON structure is complete and can be parsed.
     """
-    # Access the internal _file_handler through the module
-    from argus.log_functions import _file_handler
-    if _file_handler:
-        _file_handler.close()
+    # Detach the queue handler, let the background writer drain its queue,
+    # then close the file, as turning file logging off would
+    from argus.log_functions import _close_file_logging
+    _close_file_logging()
+
+
+def temp_dir_for(test_case):
+    """Create a temporary directory removed when a test finishes.
+
+    Args:
+        test_case: The test the directory is for.
+
+    Returns:
+        The path of the new directory.
+    """
+    temp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+    # Cleanups run after tearDown, once any log file has been closed
+    test_case.addCleanup(temp_dir.cleanup)
+    return temp_dir.name